@@ -53,72 +53,145 @@ SUIT_SYMBOLS = {
     Suit.SPADES: "♠",
 }
 
+# Index of each suit within a rank; see Card.to_int().
+SUIT_INDEX: dict[Suit, int] = {suit: i for i, suit in enumerate(Suit)}
+
+# Precomputed short strings ("Ah", "Tc", ...) and their reverse mapping,
+# so repr() and from_str() are single dict lookups.
+_CARD_REPR: dict[tuple[Rank, Suit], str] = {
+    (rank, suit): f"{symbol}{suit.value}"
+    for rank, symbol in RANK_SYMBOLS.items()
+    for suit in Suit
+}
+_CARD_PARSE: dict[str, tuple[Rank, Suit]] = {
+    text: key for key, text in _CARD_REPR.items()
+}
+
+
+# Interned Card instances, keyed by (rank, suit).  Populated at import time
+# below; also keyed by the raw (int, str) values used in serialized dicts.
+_CARD_POOL: dict[tuple[int, str], Card] = {}
+
 
 class Card:
-    __slots__ = ("rank", "suit")
+    """A single playing card.
+
+    Cards are immutable flyweights: there is exactly one instance per
+    rank/suit, so constructing or deserializing a card never allocates.
+    """
 
-    def __init__(self, rank: Rank, suit: Suit) -> None:
-        self.rank = rank
-        self.suit = suit
+    __slots__ = ("rank", "suit", "_code", "_dict")
+
+    def __new__(cls, rank: Rank, suit: Suit) -> Card:
+        card = _CARD_POOL.get((rank, suit))
+        if card is None:
+            card = super().__new__(cls)
+            card.rank = rank
+            card.suit = suit
+            card._code = ((rank - 2) << 2) | SUIT_INDEX[suit]
+            card._dict = {"rank": rank.value, "suit": suit.value}
+        return card
 
     def __repr__(self) -> str:
-        return f"{RANK_SYMBOLS[self.rank]}{self.suit.value}"
+        return _CARD_REPR[(self.rank, self.suit)]
 
     def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, Card):
             return NotImplemented
         return self.rank == other.rank and self.suit == other.suit
 
     def __hash__(self) -> int:
-        return hash((self.rank, self.suit))
+        return self._code
+
+    def __reduce__(self) -> tuple:
+        # __new__ requires (rank, suit), so copy/deepcopy/pickle rebuild the
+        # card from its code, which returns the interned instance.
+        return (Card.from_int, (self._code,))
 
     def to_dict(self) -> dict:
-        return {"rank": self.rank.value, "suit": self.suit.value}
+        """Return the card's JSON form.
+
+        The dict is built once per card and shared; don't mutate it.
+        """
+        return self._dict
+
+    def to_int(self) -> int:
+        """Compact 0..51 encoding: ``(rank - 2) << 2 | suit_index``."""
+        return self._code
+
+    @classmethod
+    def from_int(cls, code: int) -> Card:
+        return ALL_CARDS[code]
 
     @classmethod
     def from_dict(cls, data: dict) -> Card:
-        return cls(Rank(data["rank"]), Suit(data["suit"]))
+        card = _CARD_POOL.get((data["rank"], data["suit"]))
+        if card is None:
+            return cls(Rank(data["rank"]), Suit(data["suit"]))
+        return card
 
     @classmethod
     def from_str(cls, s: str) -> Card:
         """Parse 'Ah', 'Ts', '2c' etc."""
-        rank_char = s[0].upper()
-        suit_char = s[1].lower()
-        rank_map = {v: k for k, v in RANK_SYMBOLS.items()}
-        return cls(rank_map[rank_char], Suit(suit_char))
+        return cls(*_CARD_PARSE[s[0].upper() + s[1].lower()])
 
 
 class Deck:
-    """Standard 52-card deck with shuffle and deal."""
+    """Standard 52-card deck with shuffle and deal.
 
-    def __init__(self) -> None:
-        self._cards: list[Card] = [
-            Card(rank, suit) for suit in Suit for rank in Rank
-        ]
+    Cards are held as their 0..51 integer codes (see Card.to_int) in a
+    bytearray and only looked up as Card objects when dealt.  Dealing
+    advances a cursor instead of copying the undealt remainder.
+
+    Each deck shuffles with its own ``random.Random`` (seeded from
+    os.urandom unless *seed* is given, e.g. for reproducible tests).
+    """
+
+    def __init__(self, seed: Optional[int] = None) -> None:
+        self._rng = random.Random(seed)
+        self._cards = bytearray(range(52))
+        self._pos = 0
         self.shuffle()
 
     def shuffle(self) -> None:
-        random.shuffle(self._cards)
+        """Gather every card back into the deck and shuffle it."""
+        self._pos = 0
+        self._rng.shuffle(self._cards)
 
     def deal(self, n: int = 1) -> list[Card]:
-        if n > len(self._cards):
+        start = self._pos
+        end = start + n
+        if end > len(self._cards):
             raise ValueError("Not enough cards in deck")
-        dealt = self._cards[:n]
-        self._cards = self._cards[n:]
-        return dealt
+        self._pos = end
+        return [ALL_CARDS[code] for code in self._cards[start:end]]
 
     def deal_one(self) -> Card:
         return self.deal(1)[0]
 
     @property
     def remaining(self) -> int:
-        return len(self._cards)
+        return len(self._cards) - self._pos
 
     def to_dict(self) -> dict:
-        return {"cards": [c.to_dict() for c in self._cards]}
+        return {
+            "cards": [ALL_CARDS[code].to_dict() for code in self._cards[self._pos:]]
+        }
 
     @classmethod
     def from_dict(cls, data: dict) -> Deck:
         deck = cls.__new__(cls)
-        deck._cards = [Card.from_dict(c) for c in data["cards"]]
+        deck._rng = random.Random()
+        deck._cards = bytearray(Card.from_dict(c).to_int() for c in data["cards"])
+        deck._pos = 0
         return deck
+
+
+# The 52 interned cards, indexed by their integer code.
+ALL_CARDS: tuple[Card, ...] = tuple(Card(rank, suit) for rank in Rank for suit in Suit)
+for _card in ALL_CARDS:
+    _CARD_POOL[(_card.rank, _card.suit)] = _card
+    _CARD_POOL[(int(_card.rank), _card.suit.value)] = _card
+del _card
@@ -12,7 +12,9 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import random
 import time
+import uuid
 from typing import Any
 
 from app import redis_client
@@ -30,82 +32,236 @@ STALE_THRESHOLD: float = 24 * 60 * 60  # 24 hours
 # Inactivity threshold before a *completed* (won) game is deleted (seconds).
 COMPLETED_THRESHOLD: float = 72 * 60 * 60  # 72 hours
 
+# Each sleep is stretched by a random 0..CLEANUP_JITTER fraction of the
+# interval so several app workers don't all hit Redis at the same moment.
+CLEANUP_JITTER: float = 0.1
+
+# How long a worker holds the cleanup leader lock after taking it.  The lock
+# is not released after a successful pass: it marks the pass as done, so
+# other workers skip theirs.  It must expire before the leader's own next
+# (jittered) pass, hence under (1 - CLEANUP_JITTER) * CLEANUP_INTERVAL.
+CLEANUP_LOCK_TTL: float = CLEANUP_INTERVAL * (1 - 2 * CLEANUP_JITTER)
+
+# Maximum number of games checked concurrently during a cleanup pass.
+CLEANUP_CONCURRENCY: int = 20
+
+# Upper bound on games checked in one pass, so a pass finishes well within
+# CLEANUP_INTERVAL however large the keyspace grows.  Anything beyond the
+# budget is picked up by the following passes.
+MAX_CODES_PER_PASS: int = 500
+
+# Every Nth pass also SCANs the keyspace, a slice of up to
+# MAX_CODES_PER_PASS games per pass, to pick up games the activity index
+# doesn't know about (e.g. created before it existed).  The first pass after
+# startup starts a scan, and passes keep taking slices until it wraps
+# around.  Default: once a day.
+RECONCILE_EVERY: int = 48
+
+# Old metrics are pruned every Nth pass rather than after each one; with
+# 90 days of retention there's no hurry.  Default: every 2 hours.
+PRUNE_METRICS_EVERY: int = 4
+
+
+def _has_chips(seat: dict[str, Any]) -> bool:
+    return seat.get("chips", 0) > 0 and not seat.get("is_sitting_out")
+
 
 def _is_game_won(engine_data: dict[str, Any] | None) -> bool:
     """Return True if the game has a single winner (only one player with chips)."""
     if engine_data is None:
         return False
 
-    seats = engine_data.get("seats", [])
-    players_with_chips = [
-        s for s in seats if s.get("chips", 0) > 0 and not s.get("is_sitting_out")
-    ]
-    return len(players_with_chips) <= 1 and len(seats) >= 2
+    seats = engine_data.get("seats") or ()
+    if len(seats) < 2:
+        return False
+    # Won unless a second player with chips turns up; stop looking there.
+    found = 0
+    for seat in seats:
+        if _has_chips(seat):
+            found += 1
+            if found > 1:
+                return False
+    return True
+
+
+def _eligible_at(last_activity: float, threshold: float) -> float:
+    """Index score at which a game kept under *threshold* becomes a candidate.
+
+    Index passes only look at games scored at or before
+    ``now - min(STALE_THRESHOLD, COMPLETED_THRESHOLD)``, so a game kept
+    under the longer threshold is pushed back by the difference instead of
+    being fetched again on every pass until then.
+    """
+    return last_activity + threshold - min(STALE_THRESHOLD, COMPLETED_THRESHOLD)
+
 
+async def _check_one(
+    code: str,
+    now: float,
+    pending_metrics: list[dict[str, Any]],
+) -> tuple[str, str]:
+    """Check a single game and delete it if stale.
 
-async def cleanup_stale_games() -> dict[str, list[str]]:
-    """Scan all games in Redis and delete stale ones.
+    Kept games are written back to the activity index, scored by when they
+    next become eligible for deletion, so the index heals any drift and
+    kept games don't crowd out the candidates behind them.  Metrics for
+    deleted games are appended to *pending_metrics* for the caller to flush
+    in one write.
+
+    Returns ``("deleted", code)`` or ``("kept", code)``.
+    """
+    last_activity = await redis_client.get_last_activity(code)
+
+    # If there's no last_activity timestamp at all, treat creation time as
+    # unknown — use a generous fallback: mark activity now so it gets a
+    # full window before next check.
+    if last_activity is None:
+        await redis_client.touch_activity(code)
+        return "kept", code
+
+    age = now - last_activity
+    # A game younger than both thresholds is kept whether or not it was
+    # won, so there's no need to fetch anything else for it.
+    if age < min(STALE_THRESHOLD, COMPLETED_THRESHOLD):
+        await redis_client.index_activity(code, last_activity)
+        return "kept", code
+
+    won, game_data, player_count = await redis_client.load_cleanup_bundle(code)
+    if won is None:
+        # No meta hash (engine not saved since it was introduced) — derive
+        # the flag from the full engine state instead.
+        won = _is_game_won(await redis_client.load_engine(code))
+
+    threshold = COMPLETED_THRESHOLD if won else STALE_THRESHOLD
+
+    if age < threshold:
+        await redis_client.index_activity(
+            code, _eligible_at(last_activity, threshold)
+        )
+        return "kept", code
+
+    if not await redis_client.delete_game(code):
+        # Another pass (e.g. a manual cleanup) got there first and has
+        # recorded the metric already.
+        return "kept", code
+    final_status = game_data.get("status", "unknown") if game_data else "unknown"
+    pending_metrics.append(
+        {
+            "code": code,
+            "final_status": final_status,
+            "was_completed": won,
+            "player_count": player_count,
+        }
+    )
+    logger.info(
+        "Cleaned up game %s (age=%.1fh, won=%s)",
+        code,
+        age / 3600,
+        won,
+    )
+    return "deleted", code
+
+
+async def cleanup_stale_games(
+    reconcile: bool = False, full_scan: bool = False
+) -> dict[str, list[str]]:
+    """Find stale games in Redis and delete them.
+
+    Every pass checks the games the activity index reports as inactive for
+    at least min(STALE_THRESHOLD, COMPLETED_THRESHOLD), oldest first and at
+    most MAX_CODES_PER_PASS of them.  With *reconcile*, a further slice of
+    up to MAX_CODES_PER_PASS game keys is SCANned from the saved cursor, so
+    games missing from the index are found and re-indexed over a few passes.
+
+    With *full_scan* (the manual admin trigger) neither source is capped:
+    every index candidate and every game key is checked, and the saved
+    cursor is left alone for the background passes.
+
+    Games are checked concurrently (at most CLEANUP_CONCURRENCY at a time)
+    so Redis round-trips overlap instead of adding up.
 
     Returns a dict with 'deleted' (list of codes removed) and
     'kept' (list of codes that were checked but retained).
     """
     now = time.time()
-    codes = await redis_client.list_all_game_codes()
-    deleted: list[str] = []
-    kept: list[str] = []
-
-    for code in codes:
-        try:
-            last_activity = await redis_client.get_last_activity(code)
-
-            # If there's no last_activity timestamp at all, treat creation time as
-            # unknown — use a generous fallback: mark activity now so it gets a
-            # full window before next check.
-            if last_activity is None:
-                await redis_client.touch_activity(code)
-                kept.append(code)
-                continue
-
-            age = now - last_activity
+    stale_before = now - min(STALE_THRESHOLD, COMPLETED_THRESHOLD)
+    if full_scan:
+        codes = await redis_client.list_inactive_game_codes(stale_before)
+        codes += await redis_client.list_all_game_codes()
+    else:
+        codes = await redis_client.list_inactive_game_codes(
+            stale_before, limit=MAX_CODES_PER_PASS
+        )
+        if len(codes) >= MAX_CODES_PER_PASS:
+            logger.warning(
+                "Cleanup pass capped at %d stale candidates; consider raising "
+                "MAX_CODES_PER_PASS",
+                MAX_CODES_PER_PASS,
+            )
+        if reconcile:
+            cursor = await redis_client.get_cleanup_cursor()
+            cursor, scanned = await redis_client.scan_game_codes(
+                cursor, MAX_CODES_PER_PASS
+            )
+            await redis_client.set_cleanup_cursor(cursor)
+            if cursor != 0:
+                logger.info(
+                    "Cleanup scan budget reached (%d games); resuming next pass",
+                    len(scanned),
+                )
+            codes += scanned
+    # The index and the scan overlap; check each game once.
+    codes = list(dict.fromkeys(codes))
+    if not codes:
+        return {"deleted": [], "kept": []}
 
-            engine_data = await redis_client.load_engine(code)
-            won = _is_game_won(engine_data)
+    sem = asyncio.Semaphore(CLEANUP_CONCURRENCY)
+    pending_metrics: list[dict[str, Any]] = []
 
-            threshold = COMPLETED_THRESHOLD if won else STALE_THRESHOLD
+    async def _bounded(code: str) -> tuple[str, str]:
+        async with sem:
+            return await _check_one(code, now, pending_metrics)
 
-            if age >= threshold:
-                # Record metric before deleting
-                game_data = await redis_client.load_game(code)
-                players = await redis_client.load_all_players(code)
-                final_status = (
-                    game_data.get("status", "unknown") if game_data else "unknown"
-                )
-                await metrics.record_game_cleaned(
-                    code=code,
-                    final_status=final_status,
-                    was_completed=won,
-                    player_count=len(players),
-                )
-
-                await redis_client.delete_game(code)
-                logger.info(
-                    "Cleaned up game %s (age=%.1fh, won=%s)",
-                    code,
-                    age / 3600,
-                    won,
-                )
-                deleted.append(code)
-            else:
-                kept.append(code)
+    try:
+        results = await asyncio.gather(
+            *(_bounded(code) for code in codes), return_exceptions=True
+        )
+    finally:
+        # Metrics are written after the deletions, so flush whatever was
+        # deleted even if the pass is cancelled part-way through.
+        try:
+            await metrics.record_games_cleaned_bulk(pending_metrics)
         except Exception:
-            logger.exception("Error checking game %s for cleanup", code)
+            logger.exception(
+                "Failed to record %d cleanup metric(s)", len(pending_metrics)
+            )
+
+    deleted: list[str] = []
+    kept: list[str] = []
+    for code, result in zip(codes, results):
+        if isinstance(result, BaseException):
+            logger.error(
+                "Error checking game %s for cleanup",
+                code,
+                exc_info=result,
+            )
+            kept.append(code)
+            # Score it as the newest candidate, so the next pass retries it
+            # after everything older rather than fetching it first again.
+            try:
+                await redis_client.index_activity(code, stale_before)
+            except Exception:
+                logger.exception("Failed to re-index game %s", code)
+        elif result[0] == "deleted":
+            deleted.append(code)
+        else:
             kept.append(code)
 
     return {"deleted": deleted, "kept": kept}
 
 
 async def _prune_metrics() -> None:
-    """Prune old metrics entries (called after each cleanup pass)."""
+    """Prune old metrics entries (called every PRUNE_METRICS_EVERY passes)."""
     try:
         await metrics.prune_old_metrics()
     except Exception:
@@ -117,6 +273,9 @@ class GameCleaner:
 
     def __init__(self) -> None:
         self._task: asyncio.Task | None = None
+        self._pass_count: int = 0
+        # Identifies this process as the holder of the cleanup leader lock.
+        self._worker_id: str = uuid.uuid4().hex
 
     def start(self) -> None:
         if self._task is None or self._task.done():
@@ -130,11 +289,42 @@ class GameCleaner:
 
     async def _loop(self) -> None:
         try:
+            # Passes are scheduled against a fixed monotonic cadence, so the
+            # time a pass takes doesn't push every later pass back.
+            next_at = time.monotonic() + CLEANUP_INTERVAL
             while True:
-                await asyncio.sleep(CLEANUP_INTERVAL)
+                delay = next_at - time.monotonic()
+                if delay < 0:
+                    # A pass overran the interval; start the next one now
+                    # rather than firing a backlog of passes back to back.
+                    next_at -= delay
+                    delay = 0.0
+                await asyncio.sleep(
+                    delay + random.uniform(0, CLEANUP_INTERVAL * CLEANUP_JITTER)
+                )
+                next_at += CLEANUP_INTERVAL
+                # Every app worker runs this loop; whichever takes the leader
+                # lock first does the pass, and the others skip until it
+                # expires (shortly before the leader's own next pass is due).
+                try:
+                    if not await redis_client.acquire_cleanup_lock(
+                        self._worker_id, int(CLEANUP_LOCK_TTL * 1000)
+                    ):
+                        logger.debug("Cleanup pass skipped: another worker is leader")
+                        continue
+                except Exception:
+                    logger.exception("Failed to acquire cleanup lock")
+                    continue
                 try:
-                    result = await cleanup_stale_games()
-                    await _prune_metrics()
+                    pass_no = self._pass_count
+                    self._pass_count += 1
+                    reconcile = (
+                        pass_no % RECONCILE_EVERY == 0
+                        or await redis_client.get_cleanup_cursor() != 0
+                    )
+                    result = await cleanup_stale_games(reconcile=reconcile)
+                    if pass_no % PRUNE_METRICS_EVERY == 0:
+                        await _prune_metrics()
                     if result["deleted"]:
                         logger.info(
                             "Cleanup pass: deleted %d game(s): %s",
@@ -145,6 +335,11 @@ class GameCleaner:
                         logger.debug("Cleanup pass: nothing to delete")
                 except Exception:
                     logger.exception("Cleanup pass failed")
+                    # Let another worker retry instead of waiting out the lock.
+                    try:
+                        await redis_client.release_cleanup_lock(self._worker_id)
+                    except Exception:
+                        logger.exception("Failed to release cleanup lock")
         except asyncio.CancelledError:
             pass
 
@@ -6,10 +6,11 @@ pot management, showdown, dealer rotation, and hand lifecycle.
 
 from __future__ import annotations
 
-import bisect
+import sys
 import time
+from bisect import bisect_left
 from enum import Enum
-from typing import Any, Optional
+from typing import AbstractSet, Any, Optional
 
 from app.cards import Card, Deck
 from app.evaluator import HandCategory, evaluate, determine_winners
@@ -34,8 +35,27 @@ class PlayerAction(str, Enum):
 class PlayerState:
     """Per-hand state for a single player."""
 
+    __slots__ = (
+        "player_id",
+        "name",
+        "chips",
+        "hole_cards",
+        "bet_this_round",
+        "bet_this_hand",
+        "folded",
+        "all_in",
+        "has_acted",
+        "is_sitting_out",
+        "last_action",
+        "rebuy_count",
+        "rebuy_queued",
+    )
+
     def __init__(self, player_id: str, name: str, chips: int) -> None:
-        self.player_id = player_id
+        # Interned, as are the ids coming in through process_action,
+        # get_player_view and from_dict's shown_cards, so seat lookups and
+        # shown_cards checks by id mostly short-circuit on identity
+        self.player_id = sys.intern(player_id)
         self.name = name
         self.chips = chips
         self.hole_cards: list[Card] = []
@@ -101,48 +121,63 @@ def _round_blind(value: float) -> int:
 
 
 # Standard tournament blind values: factors [1,1.5,2,2.5,3,4,5,6,8] × decade
-_STANDARD_BLINDS: list[int] = sorted({
-    round(f * d)
-    for d in (1, 10, 100, 1_000, 10_000, 100_000)
-    for f in (1, 1.5, 2, 2.5, 3, 4, 5, 6, 8)
-})
+# (1 .. 100_000), rounded and deduplicated.  Written out so import does no
+# work; tests check it against the rule.
+_STANDARD_BLINDS: tuple[int, ...] = (
+    1, 2, 3, 4, 5, 6, 8,
+    10, 15, 20, 25, 30, 40, 50, 60, 80,
+    100, 150, 200, 250, 300, 400, 500, 600, 800,
+    1_000, 1_500, 2_000, 2_500, 3_000, 4_000, 5_000, 6_000, 8_000,
+    10_000, 15_000, 20_000, 25_000, 30_000, 40_000, 50_000, 60_000, 80_000,
+    100_000, 150_000, 200_000, 250_000, 300_000, 400_000, 500_000, 600_000, 800_000,
+)
+
+# Padded with sentinels that always lose the nearest-value comparison, so
+# every bisect lands between two entries and needs no boundary checks
+_BLINDS_PADDED: tuple[float, ...] = (float("-inf"), *_STANDARD_BLINDS, float("inf"))
 
 
 def _nice_blind(value: float) -> int:
     """Snap a value to the nearest standard tournament blind amount."""
     if value <= 1:
         return 1
-    v = round(value)
-    idx = bisect.bisect_left(_STANDARD_BLINDS, v)
-    if idx == 0:
-        return _STANDARD_BLINDS[0]
-    if idx >= len(_STANDARD_BLINDS):
-        return _STANDARD_BLINDS[-1]
-    lo = _STANDARD_BLINDS[idx - 1]
-    hi = _STANDARD_BLINDS[idx]
+    idx = bisect_left(_BLINDS_PADDED, round(value))
+    lo = _BLINDS_PADDED[idx - 1]
+    hi = _BLINDS_PADDED[idx]
     return lo if (value - lo) <= (hi - value) else hi
 
 
+# Street that follows each betting street, and how many board cards it deals
+_NEXT_STREET: dict[Street, tuple[Street, int]] = {
+    Street.PREFLOP: (Street.FLOP, 3),
+    Street.FLOP: (Street.TURN, 1),
+    Street.TURN: (Street.RIVER, 1),
+}
+
+# Argument-free entries of get_valid_actions, shared rather than rebuilt
+# for every view (never mutated)
+_FOLD_ACTION: dict[str, Any] = {"action": "fold"}
+_CHECK_ACTION: dict[str, Any] = {"action": "check"}
+
+# Finished hand histories kept on the engine (and so in every persisted
+# snapshot); older ones are dropped.
+MAX_HAND_HISTORIES = 50
+
+
 class HandHistory:
     """Records actions for a single hand."""
 
     def __init__(self, hand_number: int) -> None:
         self.hand_number = hand_number
-        self.actions: list[dict[str, Any]] = []
+        # (player_id, action, amount, street) — expanded to dicts in to_dict
+        self.actions: list[tuple[str, str, int, str]] = []
         self.community_cards: list[list[dict]] = []
         self.winners: list[dict[str, Any]] = []
 
     def record_action(
-        self, player_id: str, action: PlayerAction, amount: int, street: Street
+        self, player_id: str, action: str, amount: int, street: Street
     ) -> None:
-        self.actions.append(
-            {
-                "player_id": player_id,
-                "action": action.value,
-                "amount": amount,
-                "street": street.value,
-            }
-        )
+        self.actions.append((player_id, action, amount, street.value))
 
     def record_community(self, cards: list[Card]) -> None:
         self.community_cards.append([c.to_dict() for c in cards])
@@ -153,7 +188,10 @@ class HandHistory:
     def to_dict(self) -> dict[str, Any]:
         return {
             "hand_number": self.hand_number,
-            "actions": self.actions,
+            "actions": [
+                {"player_id": pid, "action": action, "amount": amount, "street": street}
+                for pid, action, amount, street in self.actions
+            ],
             "community_cards": self.community_cards,
             "winners": self.winners,
         }
@@ -229,12 +267,18 @@ class GameEngine:
         else:
             self.blind_schedule = []
         self.blind_level: int = 0  # current index into blind_schedule
+        # JSON-ready copy of blind_schedule, see _blind_schedule_payload()
+        self._schedule_payload: list[list[int]] = []
 
         # Seat players in order
         self.seats: list[PlayerState] = []
         for p in players:
             ps = PlayerState(p["id"], p["name"], starting_chips)
             self.seats.append(ps)
+        # Seats never change after the game starts, so index them once
+        self._id_to_idx: dict[str, int] = {
+            p.player_id: i for i, p in enumerate(self.seats)
+        }
 
         # Dealer button position (index into self.seats)
         self.dealer_idx: int = 0
@@ -362,32 +406,21 @@ class GameEngine:
                 nxt = schedule_bb[-1] + 1  # safety: guarantee forward progress
             schedule_bb.append(nxt)
 
-        # Build (SB, BB) tuples — SB is always BB // 2
+        # Build (SB, BB) tuples — SB is always BB // 2, so dropping repeated
+        # BBs also deduplicates consecutive identical levels
         schedule: list[tuple[int, int]] = []
+        prev_bb = None
         for bb in schedule_bb:
-            sb = max(1, bb // 2)
-            schedule.append((sb, bb))
-
-        # Deduplicate consecutive identical levels
-        deduped: list[tuple[int, int]] = [schedule[0]]
-        for level in schedule[1:]:
-            if level != deduped[-1]:
-                deduped.append(level)
+            if bb != prev_bb:
+                schedule.append((max(1, bb // 2), bb))
+                prev_bb = bb
 
-        return deduped
+        return schedule
 
     # ------------------------------------------------------------------
     # Accessors
     # ------------------------------------------------------------------
 
-    def _active_players(self) -> list[int]:
-        """Indices of players still in the hand (not folded, not all-in with 0 chips)."""
-        return [
-            i
-            for i, p in enumerate(self.seats)
-            if not p.folded and not p.is_sitting_out
-        ]
-
     def _players_who_can_act(self) -> list[int]:
         """Indices of players who can still take actions."""
         return [
@@ -404,6 +437,20 @@ class GameEngine:
             if not p.folded and not p.is_sitting_out
         ]
 
+    def _live_seat_count(self) -> int:
+        """Number of seats not sitting out."""
+        return sum(1 for p in self.seats if not p.is_sitting_out)
+
+    def _last_player_in_hand(self) -> Optional[int]:
+        """Index of the only non-folded player, or None if there are several."""
+        found = None
+        for i, p in enumerate(self.seats):
+            if not p.folded and not p.is_sitting_out:
+                if found is not None:
+                    return None
+                found = i
+        return found
+
     def _next_seat(self, idx: int, only_active: bool = False) -> int:
         """Find next occupied seat after idx, wrapping around."""
         n = len(self.seats)
@@ -469,6 +516,16 @@ class GameEngine:
             self.small_blind = sb
             self.big_blind = bb
 
+    def _blind_schedule_payload(self) -> list[list[int]]:
+        """blind_schedule as [sb, bb] pairs for state dicts.
+
+        The schedule only ever grows, so the converted list is reused by
+        every view until a level is appended.  Treat it as read-only.
+        """
+        if len(self._schedule_payload) != len(self.blind_schedule):
+            self._schedule_payload = [[sb, bb] for sb, bb in self.blind_schedule]
+        return self._schedule_payload
+
     def get_next_blind_change_at(self) -> Optional[float]:
         """Return the Unix timestamp when the next blind level will start, or None."""
         if (
@@ -493,20 +550,23 @@ class GameEngine:
             return self._build_state()
 
         # Process queued rebuys first
+        rebought_ids: set[str] = set()
         for p in self.seats:
             if p.rebuy_queued:
                 p.chips = self.starting_chips
                 p.is_sitting_out = False
                 p.rebuy_count += 1
                 p.rebuy_queued = False
-                # Remove from elimination order — they're back in the game
-                self.elimination_order = [
-                    e for e in self.elimination_order
-                    if e["player_id"] != p.player_id
-                ]
+                rebought_ids.add(p.player_id)
+        if rebought_ids:
+            # Remove from elimination order — they're back in the game
+            self.elimination_order = [
+                e for e in self.elimination_order
+                if e["player_id"] not in rebought_ids
+            ]
 
         # Record any remaining busted players in elimination order
-        eliminated_ids = {e["player_id"] for e in self.elimination_order}
+        eliminated_ids = self._eliminated_ids()
         for p in self.seats:
             if p.chips <= 0 and not p.rebuy_queued:
                 if p.player_id not in eliminated_ids:
@@ -517,8 +577,7 @@ class GameEngine:
                     })
                 p.is_sitting_out = True
 
-        live_players = [i for i, p in enumerate(self.seats) if not p.is_sitting_out]
-        if len(live_players) < 2:
+        if self._live_seat_count() < 2:
             self.game_over = True
             self.final_standings = self._build_final_standings()
             winner_name = self.final_standings[0]["name"] if self.final_standings else "Unknown"
@@ -546,9 +605,11 @@ class GameEngine:
             self.dealer_idx = self._next_seat(self.dealer_idx)
 
         # Reset per-hand state
+        dealt_in: list[PlayerState] = []
         for p in self.seats:
             if not p.is_sitting_out:
                 p.reset_for_new_hand()
+                dealt_in.append(p)
             else:
                 # Clear stale status from previous hand for sitting-out players
                 p.folded = False
@@ -559,7 +620,13 @@ class GameEngine:
                 p.bet_this_hand = 0
                 p.hole_cards = []
 
+        # Deal hole cards: one draw for the table, two consecutive cards per
+        # player in seat order
         self.deck = Deck()
+        hole_cards = self.deck.deal(2 * len(dealt_in))
+        for k, p in enumerate(dealt_in):
+            p.hole_cards = hole_cards[2 * k:2 * k + 2]
+
         self.community_cards = []
         self.street = Street.PREFLOP
         self.pot = 0
@@ -570,21 +637,18 @@ class GameEngine:
         self.current_history = HandHistory(self.hand_number)
         self.hand_active = True
 
-        # Deal hole cards
-        for p in self.seats:
-            if not p.is_sitting_out:
-                p.hole_cards = self.deck.deal(2)
-
         # Post blinds
-        self._post_blinds()
+        self._post_blinds(heads_up=len(dealt_in) == 2)
 
         return self._build_state()
 
-    def _post_blinds(self) -> None:
-        """Post small and big blinds."""
-        live = [i for i, p in enumerate(self.seats) if not p.is_sitting_out]
+    def _post_blinds(self, heads_up: bool) -> None:
+        """Post small and big blinds.
 
-        if len(live) == 2:
+        *heads_up* is whether exactly two players were dealt in; the caller
+        already knows, so the seats aren't counted again here.
+        """
+        if heads_up:
             # Heads-up: dealer posts small blind
             sb_idx = self.dealer_idx
             bb_idx = self._next_seat(self.dealer_idx)
@@ -609,15 +673,19 @@ class GameEngine:
         """Force a player to bet (blinds/antes). Returns actual amount posted."""
         p = self.seats[idx]
         actual = min(amount, p.chips)
-        p.chips -= actual
-        p.bet_this_round += actual
-        p.bet_this_hand += actual
-        self.pot += actual
+        self._apply_bet(p, actual)
         if label:
             p.last_action = f"{label} {actual}"
+        return actual
+
+    def _apply_bet(self, p: PlayerState, amount: int) -> None:
+        """Move *amount* of p's chips into the pot (marks p all-in when emptied)."""
+        p.chips -= amount
+        p.bet_this_round += amount
+        p.bet_this_hand += amount
+        self.pot += amount
         if p.chips == 0:
             p.all_in = True
-        return actual
 
     # ------------------------------------------------------------------
     # Action Processing
@@ -637,11 +705,11 @@ class GameEngine:
         to_call = self.current_bet - p.bet_this_round
 
         # Fold is always available
-        actions.append({"action": "fold"})
+        actions.append(_FOLD_ACTION)
 
         # Check (only if nothing to call)
         if to_call == 0:
-            actions.append({"action": "check"})
+            actions.append(_CHECK_ACTION)
 
         # Call
         if to_call > 0:
@@ -680,6 +748,7 @@ class GameEngine:
         self, player_id: str, action: str, amount: int = 0
     ) -> dict[str, Any]:
         """Process a player action. Returns updated game state."""
+        player_id = sys.intern(player_id)
         idx = self._find_player_idx(player_id)
         if idx is None:
             raise ValueError("Player not found")
@@ -694,25 +763,25 @@ class GameEngine:
 
         to_call = self.current_bet - p.bet_this_round
 
-        if action == PlayerAction.FOLD.value or action == "fold":
+        if action == "fold":
             self._do_fold(idx)
-        elif action == PlayerAction.CHECK.value or action == "check":
+        elif action == "check":
             if to_call > 0:
                 raise ValueError("Cannot check, must call or fold")
             self._do_check(idx)
-        elif action == PlayerAction.CALL.value or action == "call":
-            self._do_call(idx)
-        elif action == PlayerAction.RAISE.value or action == "raise":
+        elif action == "call":
+            self._do_call(idx, to_call)
+        elif action == "raise":
             self._do_raise(idx, amount)
-        elif action == PlayerAction.ALL_IN.value or action == "all_in":
+        elif action == "all_in":
             self._do_all_in(idx)
         else:
             raise ValueError(f"Unknown action: {action}")
 
         # Check if hand is over (only one player left)
-        in_hand = self._players_in_hand()
-        if len(in_hand) == 1:
-            return self._award_pot_to_last_player(in_hand[0])
+        last_idx = self._last_player_in_hand()
+        if last_idx is not None:
+            return self._award_pot_to_last_player(last_idx)
 
         # Check if betting round is complete
         if self._is_round_complete():
@@ -730,7 +799,7 @@ class GameEngine:
         p.last_action = "Fold"
         if self.current_history:
             self.current_history.record_action(
-                p.player_id, PlayerAction.FOLD, 0, self.street
+                p.player_id, "fold", 0, self.street
             )
 
     def _do_check(self, idx: int) -> None:
@@ -739,46 +808,35 @@ class GameEngine:
         p.last_action = "Check"
         if self.current_history:
             self.current_history.record_action(
-                p.player_id, PlayerAction.CHECK, 0, self.street
+                p.player_id, "check", 0, self.street
             )
 
-    def _do_call(self, idx: int) -> None:
+    def _do_call(self, idx: int, to_call: int) -> None:
         p = self.seats[idx]
-        to_call = self.current_bet - p.bet_this_round
         actual = min(to_call, p.chips)
-        p.chips -= actual
-        p.bet_this_round += actual
-        p.bet_this_hand += actual
-        self.pot += actual
+        self._apply_bet(p, actual)
         p.has_acted = True
-        p.last_action = f"Call {actual}"
-        if p.chips == 0:
-            p.all_in = True
-            p.last_action = f"All-In {actual}"
+        p.last_action = f"All-In {actual}" if p.all_in else f"Call {actual}"
         if self.current_history:
             self.current_history.record_action(
-                p.player_id, PlayerAction.CALL, actual, self.street
+                p.player_id, "call", actual, self.street
             )
 
     def _do_raise(self, idx: int, total_bet_amount: int) -> None:
         """Raise to total_bet_amount (the total amount the player puts in this round)."""
         p = self.seats[idx]
-        to_call = self.current_bet - p.bet_this_round
-        min_raise_to = self.current_bet + self.min_raise
+        chips = p.chips
+        current_bet = self.current_bet
+        min_raise_by = current_bet + self.min_raise - p.bet_this_round
 
         # total_bet_amount is how much the player wants to put in total this round
-        if total_bet_amount < min_raise_to - p.bet_this_round and total_bet_amount < p.chips:
-            raise ValueError(
-                f"Raise must be at least {min_raise_to - p.bet_this_round}"
-            )
+        if total_bet_amount < min_raise_by and total_bet_amount < chips:
+            raise ValueError(f"Raise must be at least {min_raise_by}")
 
-        actual = min(total_bet_amount, p.chips)
-        raise_size = (p.bet_this_round + actual) - self.current_bet
+        actual = min(total_bet_amount, chips)
+        raise_size = (p.bet_this_round + actual) - current_bet
 
-        p.chips -= actual
-        p.bet_this_round += actual
-        p.bet_this_hand += actual
-        self.pot += actual
+        self._apply_bet(p, actual)
 
         if raise_size > 0:
             self.min_raise = max(self.min_raise, raise_size)
@@ -786,51 +844,44 @@ class GameEngine:
         self.current_bet = p.bet_this_round
         self.last_raiser_idx = idx
         p.has_acted = True
-        p.last_action = f"Raise {actual}"
+        p.last_action = f"All-In {p.bet_this_hand}" if p.all_in else f"Raise {actual}"
 
-        if p.chips == 0:
-            p.all_in = True
-            p.last_action = f"All-In {p.bet_this_hand}"
-
-        # Reset has_acted for other active players (they need to respond)
-        for i, other in enumerate(self.seats):
-            if i != idx and other.is_active and not other.folded:
-                other.has_acted = False
+        # Other active players need to respond to the raise
+        self._reset_others_acted(idx)
 
         if self.current_history:
             self.current_history.record_action(
-                p.player_id, PlayerAction.RAISE, actual, self.street
+                p.player_id, "raise", actual, self.street
             )
 
+    def _reset_others_acted(self, idx: int) -> None:
+        """Make every other player who can still act respond to a raise."""
+        for i, other in enumerate(self.seats):
+            if i != idx and other.is_active:
+                other.has_acted = False
+
     def _do_all_in(self, idx: int) -> None:
         """Go all-in."""
         p = self.seats[idx]
         amount = p.chips
         new_total = p.bet_this_round + amount
 
-        if new_total > self.current_bet:
+        raise_size = new_total - self.current_bet
+        if raise_size > 0:
             # This is effectively a raise
-            raise_size = new_total - self.current_bet
             if raise_size >= self.min_raise:
                 self.min_raise = raise_size
             self.current_bet = new_total
             self.last_raiser_idx = idx
-            # Reset has_acted for others
-            for i, other in enumerate(self.seats):
-                if i != idx and other.is_active and not other.folded:
-                    other.has_acted = False
+            self._reset_others_acted(idx)
 
-        p.chips = 0
-        p.bet_this_round = new_total
-        p.bet_this_hand += amount
-        self.pot += amount
-        p.all_in = True
+        self._apply_bet(p, amount)
         p.has_acted = True
         p.last_action = f"All-In {p.bet_this_hand}"
 
         if self.current_history:
             self.current_history.record_action(
-                p.player_id, PlayerAction.ALL_IN, amount, self.street
+                p.player_id, "all_in", amount, self.street
             )
 
     # ------------------------------------------------------------------
@@ -838,18 +889,17 @@ class GameEngine:
     # ------------------------------------------------------------------
 
     def _is_round_complete(self) -> bool:
-        """Check if the current betting round is complete."""
-        actors = self._players_who_can_act()
-        if not actors:
-            return True
+        """Check if the current betting round is complete.
 
-        for i in actors:
-            p = self.seats[i]
-            if not p.has_acted:
-                return False
-            if p.bet_this_round < self.current_bet and not p.all_in:
+        Every player who can still act must have acted and matched the
+        current bet (trivially true when nobody can act).
+        """
+        current_bet = self.current_bet
+        for p in self.seats:
+            if p.is_sitting_out or not p.is_active:
+                continue
+            if not p.has_acted or p.bet_this_round < current_bet:
                 return False
-
         return True
 
     def _advance_street(self) -> dict[str, Any]:
@@ -862,43 +912,20 @@ class GameEngine:
         self.min_raise = self.big_blind
         self.last_raiser_idx = None
 
-        # If only one (or zero) players can act, run out the board
-        can_act = self._players_who_can_act()
-
-        if self.street == Street.PREFLOP:
-            self.street = Street.FLOP
-            assert self.deck is not None
-            self.deck.deal_one()  # burn
-            flop = self.deck.deal(3)
-            self.community_cards.extend(flop)
-            if self.current_history:
-                self.current_history.record_community(flop)
-        elif self.street == Street.FLOP:
-            self.street = Street.TURN
-            assert self.deck is not None
-            self.deck.deal_one()  # burn
-            turn = self.deck.deal(1)
-            self.community_cards.extend(turn)
-            if self.current_history:
-                self.current_history.record_community(turn)
-        elif self.street == Street.TURN:
-            self.street = Street.RIVER
-            assert self.deck is not None
-            self.deck.deal_one()  # burn
-            river = self.deck.deal(1)
-            self.community_cards.extend(river)
-            if self.current_history:
-                self.current_history.record_community(river)
-        elif self.street == Street.RIVER:
-            return self._showdown()
-
-        # If fewer than 2 players can act, run out remaining streets
-        if len(can_act) < 2:
-            return self._advance_street()
+        # If only one (or zero) players can act there's no more betting:
+        # run out the board straight to showdown.
+        run_out = len(self._players_who_can_act()) < 2
+
+        while True:
+            next_street = _NEXT_STREET.get(self.street)
+            if next_street is None:
+                return self._showdown()
+            self._deal_street(*next_street)
+            if not run_out:
+                break
 
         # Set action to first active player after dealer
-        live = [i for i, p in enumerate(self.seats) if not p.is_sitting_out]
-        if len(live) == 2:
+        if self._live_seat_count() == 2:
             # Heads-up: dealer acts first post-flop
             self.action_on_idx = self.dealer_idx
             if not self.seats[self.action_on_idx].is_active:
@@ -913,6 +940,16 @@ class GameEngine:
         self._set_action_deadline()
         return self._build_state()
 
+    def _deal_street(self, street: Street, n_cards: int) -> None:
+        """Burn one card and deal *n_cards* to the board for *street*."""
+        self.street = street
+        assert self.deck is not None
+        self.deck.deal_one()  # burn
+        cards = self.deck.deal(n_cards)
+        self.community_cards.extend(cards)
+        if self.current_history:
+            self.current_history.record_community(cards)
+
     # ------------------------------------------------------------------
     # Showdown & Pot Award
     # ------------------------------------------------------------------
@@ -924,44 +961,52 @@ class GameEngine:
         Each pot is the portion that the eligible players contributed equally to.
         """
         in_hand = self._players_in_hand()
+        seats = self.seats
 
         # Gather unique contribution levels from non-folded players
         contribution_levels: list[int] = sorted(
-            set(self.seats[i].bet_this_hand for i in in_hand)
+            set(seats[i].bet_this_hand for i in in_hand)
         )
 
         # Also include folded players' contributions in the pool
         # (they contributed but can't win)
-        all_contributions = {
-            i: self.seats[i].bet_this_hand
-            for i in range(len(self.seats))
-            if not self.seats[i].is_sitting_out and self.seats[i].bet_this_hand > 0
-        }
+        contribs = sorted(
+            p.bet_this_hand
+            for p in seats
+            if not p.is_sitting_out and p.bet_this_hand > 0
+        )
+        n = len(contribs)
 
         pots: list[tuple[int, list[int]]] = []
         prev_level = 0
+        # Single sweep over the sorted contributions: ``covered`` is what
+        # everyone has put in up to the current level (sum of
+        # min(contrib, level)), so each pot is the growth since the last one.
+        j = 0
+        below = 0
+        prev_covered = 0
+        eligible = in_hand
 
         for level in contribution_levels:
             slice_amount = level - prev_level
             if slice_amount <= 0:
                 continue
 
-            # Everyone who contributed at least this level pays into this pot
-            pot_total = 0
-            for idx, contrib in all_contributions.items():
-                take = min(slice_amount, contrib - prev_level)
-                if take > 0:
-                    pot_total += take
+            while j < n and contribs[j] <= level:
+                below += contribs[j]
+                j += 1
+            covered = below + level * (n - j)
+            pot_total = covered - prev_covered
 
-            # Only non-folded players who contributed at least this level are eligible
-            eligible = [
-                i for i in in_hand if self.seats[i].bet_this_hand >= level
-            ]
+            # Only non-folded players who contributed at least this level are
+            # eligible; each level's list is a subset of the previous one's
+            eligible = [i for i in eligible if seats[i].bet_this_hand >= level]
 
             if pot_total > 0 and eligible:
                 pots.append((pot_total, eligible))
 
             prev_level = level
+            prev_covered = covered
 
         return pots
 
@@ -971,13 +1016,21 @@ class GameEngine:
 
         in_hand = self._players_in_hand()
         player_hands: dict[str, Any] = {}
+        # Per-player summary for last_hand_result, built in the same pass
+        hand_summaries: dict[str, dict[str, Any]] = {}
 
+        board = self.community_cards
         for i in in_hand:
             p = self.seats[i]
-            all_cards = p.hole_cards + self.community_cards
-            if len(all_cards) >= 5:
-                hand_rank = evaluate(all_cards)
+            hand_name = None
+            if len(p.hole_cards) + len(board) >= 5:
+                hand_rank = evaluate(p.hole_cards + board)
                 player_hands[p.player_id] = hand_rank
+                hand_name = hand_rank.name
+            hand_summaries[p.player_id] = {
+                "cards": [c.to_dict() for c in p.hole_cards],
+                "hand_name": hand_name,
+            }
 
         # Calculate side pots and award each one
         pots = self._calculate_pots()
@@ -987,11 +1040,11 @@ class GameEngine:
 
         for pot_amount, eligible_indices in pots:
             # Build hands map for only eligible players
-            eligible_hands = {
-                self.seats[i].player_id: player_hands[self.seats[i].player_id]
-                for i in eligible_indices
-                if self.seats[i].player_id in player_hands
-            }
+            eligible_hands = {}
+            for i in eligible_indices:
+                pid = self.seats[i].player_id
+                if pid in player_hands:
+                    eligible_hands[pid] = player_hands[pid]
 
             # Single eligible player = uncalled bet refund, not a "win"
             if len(eligible_hands) == 1:
@@ -1042,21 +1095,10 @@ class GameEngine:
             "refunds": result_refunds,
             "pot": self.pot,
             "community_cards": [c.to_dict() for c in self.community_cards],
-            "player_hands": {
-                self.seats[i].player_id: {
-                    "cards": [c.to_dict() for c in self.seats[i].hole_cards],
-                    "hand_name": player_hands[self.seats[i].player_id].name
-                    if self.seats[i].player_id in player_hands
-                    else None,
-                }
-                for i in in_hand
-            },
+            "player_hands": hand_summaries,
         }
 
-        if self.current_history:
-            self.current_history.record_winners(result_winners)
-            self.hand_histories.append(self.current_history)
-            self.current_history = None
+        self._finish_history(result_winners)
 
         self.pot = 0
         self.hand_active = False
@@ -1089,10 +1131,7 @@ class GameEngine:
             "player_hands": {},
         }
 
-        if self.current_history:
-            self.current_history.record_winners(self.last_hand_result["winners"])
-            self.hand_histories.append(self.current_history)
-            self.current_history = None
+        self._finish_history(self.last_hand_result["winners"])
 
         self.pot = 0
         self.hand_active = False
@@ -1118,7 +1157,7 @@ class GameEngine:
         """
         # Record all newly busted players in elimination order immediately.
         # They can still rebuy (which removes them from the list).
-        eliminated_ids = {e["player_id"] for e in self.elimination_order}
+        eliminated_ids = self._eliminated_ids()
         for p in self.seats:
             if (
                 p.chips <= 0
@@ -1133,8 +1172,7 @@ class GameEngine:
                 p.is_sitting_out = True
 
         # Count players who can still play
-        live_players = [p for p in self.seats if not p.is_sitting_out]
-        if len(live_players) < 2:
+        if self._live_seat_count() < 2:
             self.game_over = True
             self.final_standings = self._build_final_standings()
             winner_name = self.final_standings[0]["name"] if self.final_standings else "Unknown"
@@ -1148,7 +1186,7 @@ class GameEngine:
         standings: list[dict[str, Any]] = []
 
         # Winner is the last player standing (not in elimination order)
-        eliminated_ids = {e["player_id"] for e in self.elimination_order}
+        eliminated_ids = self._eliminated_ids()
         live = [p for p in self.seats if p.player_id not in eliminated_ids]
         for p in live:
             standings.append({
@@ -1173,8 +1211,25 @@ class GameEngine:
 
         return standings
 
-    def _can_rebuy(self, p: PlayerState) -> bool:
-        """Check if a busted player is eligible to rebuy (ignoring hand_active)."""
+    def _eliminated_ids(self) -> set[str]:
+        """Player ids currently recorded in elimination_order."""
+        return {e["player_id"] for e in self.elimination_order}
+
+    def _in_game_count(self, eliminated_ids: AbstractSet[str]) -> int:
+        """Number of seated players not in *eliminated_ids*."""
+        return sum(1 for s in self.seats if s.player_id not in eliminated_ids)
+
+    def _can_rebuy(
+        self,
+        p: PlayerState,
+        eliminated_ids: Optional[AbstractSet[str]] = None,
+        in_game_count: Optional[int] = None,
+    ) -> bool:
+        """Check if a busted player is eligible to rebuy (ignoring hand_active).
+
+        Pass *eliminated_ids* and *in_game_count* (seats not in it) when
+        checking several players in a row so neither is recomputed for each.
+        """
         if not self.allow_rebuys:
             return False
         if p.chips > 0:
@@ -1182,8 +1237,10 @@ class GameEngine:
         # Disable rebuys when it would result in heads-up or fewer.
         # Since busted players are now immediately in elimination_order,
         # count how many players would be in the game if this player rebuys.
-        eliminated_ids = {e["player_id"] for e in self.elimination_order}
-        in_game_count = sum(1 for s in self.seats if s.player_id not in eliminated_ids)
+        if eliminated_ids is None:
+            eliminated_ids = self._eliminated_ids()
+        if in_game_count is None:
+            in_game_count = self._in_game_count(eliminated_ids)
         # If this player is in elimination_order, rebuying would add them back
         would_be_in_game = in_game_count + (1 if p.player_id in eliminated_ids else 0)
         if would_be_in_game <= 2:
@@ -1269,7 +1326,7 @@ class GameEngine:
         if not p.hole_cards:
             raise ValueError("No cards to show")
 
-        self.shown_cards.add(player_id)
+        self.shown_cards.add(p.player_id)
         return self._build_state(showdown=True)
 
     def pause(self) -> dict[str, Any]:
@@ -1298,11 +1355,16 @@ class GameEngine:
     # Helpers
     # ------------------------------------------------------------------
 
+    def _finish_history(self, winners: list[dict[str, Any]]) -> None:
+        """Close out the current hand's history, keeping only the latest few."""
+        if self.current_history:
+            self.current_history.record_winners(winners)
+            self.hand_histories.append(self.current_history)
+            del self.hand_histories[:-MAX_HAND_HISTORIES]
+            self.current_history = None
+
     def _find_player_idx(self, player_id: str) -> Optional[int]:
-        for i, p in enumerate(self.seats):
-            if p.player_id == player_id:
-                return i
-        return None
+        return self._id_to_idx.get(player_id)
 
     def _find_player(self, player_id: str) -> Optional[PlayerState]:
         idx = self._find_player_idx(player_id)
@@ -1313,14 +1375,28 @@ class GameEngine:
         message: str = "",
         game_over: bool | None = None,
         showdown: bool = False,
+        reveal_ids: Optional[AbstractSet[str]] = None,
     ) -> dict[str, Any]:
-        """Build the full game state dict for broadcasting."""
+        """Build the full game state dict for broadcasting.
+
+        Hole cards are included for the players in *reveal_ids*; by default
+        that's everyone at showdown, otherwise whoever chose to show.
+        """
         # Use persisted game_over flag if not explicitly overridden
         if game_over is None:
             game_over = self.game_over
         if not message and self.game_over:
             message = self.game_over_message
 
+        if reveal_ids is None:
+            reveal_ids = self._id_to_idx.keys() if showdown else self.shown_cards
+        # _can_rebuy returns before looking at these when rebuys are off.
+        eliminated_ids: AbstractSet[str] = frozenset()
+        in_game_count = 0
+        if self.allow_rebuys:
+            eliminated_ids = self._eliminated_ids()
+            in_game_count = self._in_game_count(eliminated_ids)
+
         action_on_player_id = None
         if self.hand_active and self.action_on_idx is not None:
             p = self.seats[self.action_on_idx]
@@ -1344,8 +1420,8 @@ class GameEngine:
             "final_standings": self.final_standings if game_over else [],
             "last_hand_result": self.last_hand_result,
             "players": [
-                {**p.to_dict(reveal_cards=showdown or p.player_id in self.shown_cards),
-                 "can_rebuy": self._can_rebuy(p)}
+                {**p.to_dict(reveal_cards=p.player_id in reveal_ids),
+                 "can_rebuy": self._can_rebuy(p, eliminated_ids, in_game_count)}
                 for p in self.seats
             ],
             # Showdown reveals all non-folded cards
@@ -1358,7 +1434,7 @@ class GameEngine:
             "big_blind": self.big_blind,
             "blind_level": self.blind_level,
             "blind_level_duration": self.blind_level_duration,
-            "blind_schedule": [[sb, bb] for sb, bb in self.blind_schedule] if self.blind_schedule else [],
+            "blind_schedule": self._blind_schedule_payload(),
             "next_blind_change_at": self.get_next_blind_change_at(),
             "allow_rebuys": self.allow_rebuys,
             "max_rebuys": self.max_rebuys,
@@ -1369,8 +1445,14 @@ class GameEngine:
 
     def get_player_view(self, player_id: str) -> dict[str, Any]:
         """Build a state view for a specific player (shows their own hole cards)."""
+        player_id = sys.intern(player_id)
         is_showdown = self.street == Street.SHOWDOWN
-        state = self._build_state(showdown=is_showdown)
+        # Other players' cards are only visible once they've been shown (or
+        # auto-revealed as winners); the viewer's own come via my_cards.
+        state = self._build_state(
+            showdown=is_showdown,
+            reveal_ids=self.shown_cards - {player_id},
+        )
 
         # Add this player's hole cards
         player = self._find_player(player_id)
@@ -1379,19 +1461,6 @@ class GameEngine:
         else:
             state["my_cards"] = []
 
-        # Control card visibility per player
-        for p_data in state["players"]:
-            pid = p_data["player_id"]
-            if pid == player_id:
-                # Always strip own cards from the player list (shown via my_cards)
-                p_data.pop("hole_cards", None)
-            elif pid in self.shown_cards:
-                # Player chose to show (or auto-revealed as winner) — keep cards
-                pass
-            else:
-                # Hide cards
-                p_data.pop("hole_cards", None)
-
         # Include which players have shown their cards
         state["shown_cards"] = list(self.shown_cards)
 
@@ -1444,7 +1513,7 @@ class GameEngine:
             "game_started_at": self.game_started_at,
             "blind_level_duration": self.blind_level_duration,
             "blind_multiplier": self.blind_multiplier,
-            "blind_schedule": [[sb, bb] for sb, bb in self.blind_schedule],
+            "blind_schedule": self._blind_schedule_payload(),
             "blind_level": self.blind_level,
             "target_game_time": self.target_game_time,
             "community_cards": [c.to_dict() for c in self.community_cards],
@@ -1509,13 +1578,14 @@ class GameEngine:
         engine.target_game_time = data.get("target_game_time", 0)
         raw_schedule = data.get("blind_schedule", [])
         engine.blind_schedule = [(s[0], s[1]) for s in raw_schedule]
+        engine._schedule_payload = []
         engine.blind_level = data.get("blind_level", 0)
         engine.community_cards = [Card.from_dict(c) for c in data["community_cards"]]
         engine.last_hand_result = data.get("last_hand_result")
         deck_data = data.get("deck")
         engine.deck = Deck.from_dict(deck_data) if deck_data else None
         engine.current_history = None
-        engine.shown_cards = set(data.get("shown_cards", []))
+        engine.shown_cards = set(map(sys.intern, data.get("shown_cards", [])))
         engine.paused = data.get("paused", False)
         engine.paused_at = data.get("paused_at")
         engine.total_paused_seconds = data.get("total_paused_seconds", 0)
@@ -1538,11 +1608,15 @@ class GameEngine:
             ps.rebuy_count = s.get("rebuy_count", 0)
             ps.rebuy_queued = s.get("rebuy_queued", False)
             engine.seats.append(ps)
+        engine._id_to_idx = {p.player_id: i for i, p in enumerate(engine.seats)}
 
         engine.hand_histories = []
-        for h in data.get("hand_histories", []):
+        for h in data.get("hand_histories", [])[-MAX_HAND_HISTORIES:]:
             hh = HandHistory(h["hand_number"])
-            hh.actions = h["actions"]
+            hh.actions = [
+                (a["player_id"], a["action"], a["amount"], a["street"])
+                for a in h["actions"]
+            ]
             hh.community_cards = h["community_cards"]
             hh.winners = h["winners"]
             engine.hand_histories.append(hh)
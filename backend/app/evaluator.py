@@ -8,10 +8,9 @@ from __future__ import annotations
 
 from collections import Counter
 from enum import IntEnum
-from itertools import combinations
 from typing import Sequence
 
-from app.cards import Card, Rank
+from app.cards import Card, Rank, Suit
 
 
 class HandCategory(IntEnum):
@@ -162,6 +161,117 @@ def _evaluate_five(cards: list[Card]) -> HandRank:
     return HandRank(HandCategory.HIGH_CARD, tuple(ranks), cards)
 
 
+def _find_straight(cards: list[Card]) -> list[Card] | None:
+    """Return the highest straight in *cards* (sorted by rank, descending).
+
+    The five cards are returned high card first; for the wheel that means
+    5-4-3-2-A.
+    """
+    by_rank: dict[int, Card] = {}
+    for c in cards:
+        by_rank.setdefault(c.rank, c)
+    if len(by_rank) < 5:
+        return None
+    for high in range(14, 4, -1):
+        # high == 5 is the wheel, where the ace plays low.
+        run = [high - i if high - i > 1 else 14 for i in range(5)]
+        if all(r in by_rank for r in run):
+            return [by_rank[r] for r in run]
+    return None
+
+
+def _evaluate_best(cards: Sequence[Card]) -> HandRank:
+    """Evaluate the best 5-card hand from 6 or 7 cards in a single pass.
+
+    Rather than scoring all C(n, 5) subsets, the cards are grouped by suit
+    and rank once and the categories are tried from best to worst.  The
+    result matches the best ``_evaluate_five`` over every subset.
+    """
+    ordered = sorted(cards, key=lambda c: c.rank, reverse=True)
+
+    by_suit: dict[Suit, list[Card]] = {}
+    for c in ordered:
+        by_suit.setdefault(c.suit, []).append(c)
+    flush_cards = next((cs for cs in by_suit.values() if len(cs) >= 5), None)
+
+    if flush_cards is not None:
+        straight_flush = _find_straight(flush_cards)
+        if straight_flush is not None:
+            high = straight_flush[0].rank
+            if high == 14:
+                return HandRank(HandCategory.ROYAL_FLUSH, (14,), straight_flush)
+            return HandRank(
+                HandCategory.STRAIGHT_FLUSH, (high,), straight_flush
+            )
+
+    by_rank: dict[int, list[Card]] = {}
+    for c in ordered:
+        by_rank.setdefault(c.rank, []).append(c)
+    # Sort by (count desc, rank desc), as _evaluate_five does
+    groups = sorted(
+        by_rank.items(), key=lambda x: (len(x[1]), x[0]), reverse=True
+    )
+
+    def _kickers(used: list[int], n: int) -> list[Card]:
+        return [c for c in ordered if c.rank not in used][:n]
+
+    top_rank, top = groups[0]
+    second_rank, second = groups[1]
+
+    if len(top) == 4:
+        kicker = _kickers([top_rank], 1)
+        return HandRank(
+            HandCategory.FOUR_OF_A_KIND,
+            (top_rank, kicker[0].rank),
+            top + kicker,
+        )
+
+    if len(top) == 3 and len(second) >= 2:
+        return HandRank(
+            HandCategory.FULL_HOUSE,
+            (top_rank, second_rank),
+            top + second[:2],
+        )
+
+    if flush_cards is not None:
+        best = flush_cards[:5]
+        return HandRank(
+            HandCategory.FLUSH, tuple(c.rank for c in best), best
+        )
+
+    straight = _find_straight(ordered)
+    if straight is not None:
+        high = straight[0].rank
+        return HandRank(HandCategory.STRAIGHT, (high,), straight)
+
+    if len(top) == 3:
+        kickers = _kickers([top_rank], 2)
+        return HandRank(
+            HandCategory.THREE_OF_A_KIND,
+            (top_rank,) + tuple(c.rank for c in kickers),
+            top + kickers,
+        )
+
+    if len(top) == 2 and len(second) == 2:
+        kicker = _kickers([top_rank, second_rank], 1)
+        return HandRank(
+            HandCategory.TWO_PAIR,
+            (top_rank, second_rank, kicker[0].rank),
+            top + second + kicker,
+        )
+
+    if len(top) == 2:
+        kickers = _kickers([top_rank], 3)
+        return HandRank(
+            HandCategory.ONE_PAIR,
+            (top_rank,) + tuple(c.rank for c in kickers),
+            top + kickers,
+        )
+
+    best = ordered[:5]
+    return HandRank(HandCategory.HIGH_CARD, tuple(c.rank for c in best), best)
+
+
 def evaluate(cards: Sequence[Card]) -> HandRank:
     """Evaluate the best 5-card hand from any number of cards (typically 5-7).
 
@@ -173,14 +283,7 @@ def evaluate(cards: Sequence[Card]) -> HandRank:
     if len(cards) == 5:
         return _evaluate_five(list(cards))
 
-    best: HandRank | None = None
-    for combo in combinations(cards, 5):
-        rank = _evaluate_five(list(combo))
-        if best is None or rank > best:
-            best = rank
-
-    assert best is not None
-    return best
+    return _evaluate_best(cards)
 
 
 def determine_winners(
@@ -320,7 +320,7 @@ async def toggle_pause(request: Request, code: str, req: PauseRequest):
 @limiter.limit("10/minute")
 async def admin_cleanup(request: Request, _=Depends(verify_admin)):
     """Manually trigger stale-game cleanup. Returns deleted and kept game codes."""
-    result = await cleanup_stale_games()
+    result = await cleanup_stale_games(full_scan=True)
     return result
 
 
@@ -432,33 +432,45 @@ async def _broadcast(code: str, state):
 
 
 async def _broadcast_engine_state(code: str) -> None:
-    """Send per-player game engine view to each connected WebSocket client."""
+    """Send per-player game engine view to each connected WebSocket client.
+
+    The engine is loaded from Redis once per broadcast and every view —
+    players' and spectators' — is built from that one instance.
+    """
     connected_ids = manager.get_connected_player_ids(code)
+    spectator_count = manager.get_spectator_count(code)
+    if not connected_ids and spectator_count == 0:
+        return
+
+    try:
+        engine_data = await redis_client.load_engine(code)
+        if engine_data is None:
+            return
+        from app.engine import GameEngine
+        engine = GameEngine.from_dict(engine_data)
+    except Exception:
+        logger.debug("Failed to load engine state for %s", code, exc_info=True)
+        return
+
     for pid in connected_ids:
         try:
-            view = await game_manager.get_engine_state(code, pid)
+            view = engine.get_player_view(pid)
             msg = json.dumps({"type": "game_state", "data": view})
             await manager.send_to_player(code, pid, msg)
         except Exception:
             logger.debug("Failed to send engine state to %s in %s", pid, code, exc_info=True)
 
     # Also send a spectator-safe view to spectators (no hole cards)
-    try:
-        # Use a dummy spectator ID to get a view with no personal cards
-        spectator_count = manager.get_spectator_count(code)
-        if spectator_count > 0:
-            # Build a spectator view — load engine, get generic state
-            engine_data = await redis_client.load_engine(code)
-            if engine_data:
-                from app.engine import GameEngine
-                engine = GameEngine.from_dict(engine_data)
-                spec_view = engine.get_player_view("__spectator__")
-                spec_msg = json.dumps({"type": "game_state", "data": spec_view})
-                # Send to all spectator connections
-                for conn in list(manager._spectators.get(code, [])):
-                    await conn.send(spec_msg)
-    except Exception:
-        logger.debug("Failed to send spectator state for %s", code, exc_info=True)
+    if spectator_count > 0:
+        try:
+            # Use a dummy spectator ID to get a view with no personal cards
+            spec_view = engine.get_player_view("__spectator__")
+            spec_msg = json.dumps({"type": "game_state", "data": spec_view})
+            # Send to all spectator connections
+            for conn in list(manager._spectators.get(code, [])):
+                await conn.send(spec_msg)
+        except Exception:
+            logger.debug("Failed to send spectator state for %s", code, exc_info=True)
 
 
 async def _broadcast_connection_info(code: str) -> None:
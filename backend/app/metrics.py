@@ -40,18 +40,32 @@ async def record_game_cleaned(
     player_count: int,
 ) -> None:
     """Record that a game was cleaned up / deleted."""
+    await record_games_cleaned_bulk(
+        [
+            {
+                "code": code,
+                "final_status": final_status,
+                "was_completed": was_completed,
+                "player_count": player_count,
+            }
+        ]
+    )
+
+
+async def record_games_cleaned_bulk(entries: list[dict[str, Any]]) -> None:
+    """Record several cleaned-up games with a single ZADD.
+
+    Each entry carries the same fields as ``record_game_cleaned``'s
+    arguments; all of them are stamped with the current time.
+    """
+    if not entries:
+        return
     r = await redis_client.get_redis()
     now = time.time()
-    entry = json.dumps(
-        {
-            "code": code,
-            "cleaned_at": now,
-            "final_status": final_status,
-            "was_completed": was_completed,
-            "player_count": player_count,
-        }
+    await r.zadd(
+        METRICS_CLEANED_KEY,
+        {json.dumps({**entry, "cleaned_at": now}): now for entry in entries},
     )
-    await r.zadd(METRICS_CLEANED_KEY, {entry: now})
 
 
 METRICS_COMPLETED_KEY = "metrics:game_completed"
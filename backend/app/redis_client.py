@@ -2,14 +2,18 @@
 
 from __future__ import annotations
 
-import json
 import os
 from typing import Any, Optional
 
+import orjson
 import redis.asyncio as redis
 
 REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
 
+# COUNT hint for SCAN when enumerating game keys.  Larger values mean fewer
+# round-trips per pass at the cost of slightly longer individual SCAN calls.
+SCAN_COUNT = int(os.getenv("REDIS_SCAN_COUNT", "1000"))
+
 _pool: Optional[redis.Redis] = None
 
 
@@ -34,7 +38,7 @@ def _player_key(code: str, player_id: str) -> str:
 
 async def store_game(code: str, data: dict[str, Any]) -> None:
     r = await get_redis()
-    await r.set(_game_key(code), json.dumps(data))
+    await r.set(_game_key(code), orjson.dumps(data))
 
 
 async def load_game(code: str) -> Optional[dict[str, Any]]:
@@ -42,12 +46,12 @@ async def load_game(code: str) -> Optional[dict[str, Any]]:
     raw = await r.get(_game_key(code))
     if raw is None:
         return None
-    return json.loads(raw)
+    return orjson.loads(raw)
 
 
 async def store_player(code: str, player_id: str, data: dict[str, Any]) -> None:
     r = await get_redis()
-    await r.set(_player_key(code, player_id), json.dumps(data))
+    await r.set(_player_key(code, player_id), orjson.dumps(data))
     await r.sadd(_players_key(code), player_id)
 
 
@@ -56,7 +60,7 @@ async def load_player(code: str, player_id: str) -> Optional[dict[str, Any]]:
     raw = await r.get(_player_key(code, player_id))
     if raw is None:
         return None
-    return json.loads(raw)
+    return orjson.loads(raw)
 
 
 async def load_all_players(code: str) -> list[dict[str, Any]]:
@@ -81,9 +85,21 @@ def _engine_key(code: str) -> str:
     return f"game:{code}:engine"
 
 
+def _meta_key(code: str) -> str:
+    return f"game:{code}:meta"
+
+
 async def store_engine(code: str, data: dict[str, Any]) -> None:
+    """Store engine state, plus small derived fields in the game's meta hash.
+
+    The meta hash lets the cleanup pass tell whether a game was won without
+    loading and parsing the whole engine blob.
+    """
     r = await get_redis()
-    await r.set(_engine_key(code), json.dumps(data))
+    pipe = r.pipeline(transaction=False)
+    pipe.set(_engine_key(code), orjson.dumps(data))
+    pipe.hset(_meta_key(code), "won", int(bool(data.get("game_over"))))
+    await pipe.execute()
 
 
 async def load_engine(code: str) -> Optional[dict[str, Any]]:
@@ -91,19 +107,51 @@ async def load_engine(code: str) -> Optional[dict[str, Any]]:
     raw = await r.get(_engine_key(code))
     if raw is None:
         return None
-    return json.loads(raw)
+    return orjson.loads(raw)
 
 
 def _activity_key(code: str) -> str:
     return f"game:{code}:last_activity"
 
 
+# Sorted set of game codes scored by last-activity timestamp, so the cleanup
+# pass can ask for stale games directly instead of reading every game.  Games
+# the cleanup pass keeps past the stale threshold (won games) are re-scored
+# later, to when they next become eligible for deletion.
+ACTIVITY_INDEX_KEY = "games_by_activity"
+
+
 async def touch_activity(code: str) -> None:
     """Update the last-activity timestamp for a game (Unix epoch seconds)."""
     import time
 
     r = await get_redis()
-    await r.set(_activity_key(code), str(time.time()))
+    now = time.time()
+    pipe = r.pipeline(transaction=False)
+    pipe.set(_activity_key(code), str(now))
+    pipe.zadd(ACTIVITY_INDEX_KEY, {code: now})
+    await pipe.execute()
+
+
+async def index_activity(code: str, timestamp: float) -> None:
+    """(Re-)score a game in the activity ZSET without touching its timestamp."""
+    r = await get_redis()
+    await r.zadd(ACTIVITY_INDEX_KEY, {code: timestamp})
+
+
+async def list_inactive_game_codes(
+    before: float, limit: int | None = None
+) -> list[str]:
+    """Return codes of games whose last activity is at or before *before*.
+
+    Oldest games come first; at most *limit* codes are returned if given.
+    """
+    r = await get_redis()
+    if limit is None:
+        return await r.zrangebyscore(ACTIVITY_INDEX_KEY, "-inf", before)
+    return await r.zrangebyscore(
+        ACTIVITY_INDEX_KEY, "-inf", before, start=0, num=limit
+    )
 
 
 async def get_last_activity(code: str) -> float | None:
@@ -115,11 +163,32 @@ async def get_last_activity(code: str) -> float | None:
     return float(raw)
 
 
+async def load_cleanup_bundle(
+    code: str,
+) -> tuple[bool | None, Optional[dict[str, Any]], int]:
+    """Fetch what the cleanup pass needs for a stale game in one round-trip.
+
+    Returns (won, game_data, player_count).  *won* is None when the game
+    has no meta hash yet (engine never stored since it was introduced).
+    """
+    r = await get_redis()
+    pipe = r.pipeline(transaction=False)
+    pipe.hget(_meta_key(code), "won")
+    pipe.get(_game_key(code))
+    pipe.scard(_players_key(code))
+    raw_won, raw_game, player_count = await pipe.execute()
+    return (
+        raw_won == "1" if raw_won is not None else None,
+        orjson.loads(raw_game) if raw_game is not None else None,
+        player_count,
+    )
+
+
 async def list_all_game_codes() -> list[str]:
     """Return all game codes currently stored in Redis."""
     r = await get_redis()
     codes: set[str] = set()
-    async for key in r.scan_iter(match="game:*", count=200):
+    async for key in r.scan_iter(match="game:*", count=SCAN_COUNT):
         # Keys look like game:ABCD12, game:ABCD12:players, etc.
         parts = key.split(":")
         if len(parts) >= 2:
@@ -127,20 +196,85 @@ async def list_all_game_codes() -> list[str]:
     return list(codes)
 
 
-async def delete_game(code: str) -> None:
-    """Clean up all keys for a game."""
+async def scan_game_codes(cursor: int, limit: int) -> tuple[int, list[str]]:
+    """Resume a SCAN over game keys from *cursor* until ~*limit* codes are found.
+
+    Returns (next_cursor, codes); next_cursor is 0 once the scan has
+    covered the whole keyspace.
+    """
+    r = await get_redis()
+    codes: set[str] = set()
+    while True:
+        cursor, keys = await r.scan(cursor, match="game:*", count=SCAN_COUNT)
+        for key in keys:
+            parts = key.split(":")
+            if len(parts) >= 2:
+                codes.add(parts[1])
+        if cursor == 0 or len(codes) >= limit:
+            return cursor, list(codes)
+
+
+CLEANUP_CURSOR_KEY = "cleanup:cursor"
+
+
+async def get_cleanup_cursor() -> int:
+    """Return the saved SCAN cursor of an unfinished cleanup scan (0 if none)."""
+    r = await get_redis()
+    raw = await r.get(CLEANUP_CURSOR_KEY)
+    return int(raw) if raw else 0
+
+
+async def set_cleanup_cursor(cursor: int) -> None:
+    r = await get_redis()
+    await r.set(CLEANUP_CURSOR_KEY, str(cursor))
+
+
+CLEANUP_LOCK_KEY = "cleanup:lock"
+
+# Deletes the lock only if it still holds the caller's token, so a worker
+# whose lock already expired can't release one another worker now holds.
+_RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+
+async def acquire_cleanup_lock(owner: str, ttl_ms: int) -> bool:
+    """Try to take the cleanup leader lock for *ttl_ms* milliseconds."""
+    r = await get_redis()
+    return bool(await r.set(CLEANUP_LOCK_KEY, owner, nx=True, px=ttl_ms))
+
+
+async def release_cleanup_lock(owner: str) -> None:
+    r = await get_redis()
+    await r.eval(_RELEASE_LOCK_SCRIPT, 1, CLEANUP_LOCK_KEY, owner)
+
+
+async def delete_game(code: str) -> bool:
+    """Clean up all keys for a game.
+
+    Keys are UNLINKed (freed in the background by Redis) and the game is
+    dropped from the activity index in the same round trip.  Returns False
+    if none of the keys existed any more.
+    """
     r = await get_redis()
     player_ids = await r.smembers(_players_key(code))
     keys = [
         _game_key(code),
         _players_key(code),
         _engine_key(code),
+        _meta_key(code),
         _activity_key(code),
     ]
     for pid in player_ids:
         keys.append(_player_key(code, pid))
-    if keys:
-        await r.delete(*keys)
+    pipe = r.pipeline(transaction=False)
+    pipe.unlink(*keys)
+    pipe.zrem(ACTIVITY_INDEX_KEY, code)
+    unlinked, _ = await pipe.execute()
+    return unlinked > 0
 
 
 async def close() -> None:
@@ -1,5 +1,8 @@
 """Tests for Card, Deck, and related helpers."""
 
+import copy
+import pickle
+
 import pytest
 from app.cards import Card, Deck, Rank, Suit, RANK_SYMBOLS, SUIT_SYMBOLS
 
@@ -44,6 +47,10 @@ class TestCard:
         d = c.to_dict()
         assert d == {"rank": 11, "suit": "h"}
 
+    def test_to_dict_is_cached(self):
+        c = Card(Rank.JACK, Suit.HEARTS)
+        assert c.to_dict() is c.to_dict()
+
     def test_from_dict(self):
         c = Card.from_dict({"rank": 14, "suit": "s"})
         assert c.rank == Rank.ACE
@@ -63,6 +70,33 @@ class TestCard:
     def test_from_str_case_insensitive(self):
         assert Card.from_str("ah") == Card.from_str("Ah")
 
+    def test_cards_are_interned(self):
+        c = Card(Rank.ACE, Suit.SPADES)
+        assert Card(Rank.ACE, Suit.SPADES) is c
+        assert Card.from_dict({"rank": 14, "suit": "s"}) is c
+        assert Card.from_str("As") is c
+
+    def test_from_dict_invalid(self):
+        with pytest.raises(ValueError):
+            Card.from_dict({"rank": 15, "suit": "s"})
+
+    def test_copy_and_pickle_return_interned_card(self):
+        c = Card(Rank.ACE, Suit.SPADES)
+        assert copy.copy(c) is c
+        assert copy.deepcopy([c]) == [c]
+        assert copy.deepcopy([c])[0] is c
+        assert pickle.loads(pickle.dumps(c)) is c
+
+    def test_invalid_suit_raises(self):
+        with pytest.raises(KeyError):
+            Card(Rank.ACE, "x")
+
+    def test_int_roundtrip(self):
+        for code in range(52):
+            assert Card.from_int(code).to_int() == code
+        assert Card(Rank.TWO, Suit.HEARTS).to_int() == 0
+        assert Card(Rank.ACE, Suit.SPADES).to_int() == 51
+
 
 # ── Rank / Suit enums ───────────────────────────────────────────────
 
@@ -115,6 +149,11 @@ class TestDeck:
         for s in Suit:
             assert suit_counts[s] == 13
 
+    def test_deck_uses_interned_cards(self):
+        d = Deck()
+        for c in d.deal(52):
+            assert Card(c.rank, c.suit) is c
+
     def test_deal_reduces_remaining(self):
         d = Deck()
         d.deal(5)
@@ -132,16 +171,33 @@ class TestDeck:
         with pytest.raises(ValueError, match="Not enough cards"):
             d.deal(5)
 
+    def test_deal_does_not_repeat_cards(self):
+        d = Deck()
+        first = d.deal(5)
+        rest = d.deal(47)
+        assert not set(first) & set(rest)
+
+    def test_to_dict_excludes_dealt_cards(self):
+        d = Deck()
+        dealt = d.deal(3)
+        data = d.to_dict()
+        assert len(data["cards"]) == 49
+        assert not {Card.from_dict(c) for c in data["cards"]} & set(dealt)
+
     def test_shuffle_changes_order(self):
         """Shuffling should (almost certainly) change the deck order."""
         d1 = Deck()
-        d1._cards = [Card(r, s) for s in Suit for r in Rank]  # fixed order
-        order_before = [repr(c) for c in d1._cards]
+        d1._cards = bytearray(range(52))  # fixed order
+        order_before = list(d1._cards)
         d1.shuffle()
-        order_after = [repr(c) for c in d1._cards]
+        order_after = list(d1._cards)
         # Extremely unlikely to be the same
         assert order_before != order_after
 
+    def test_seeded_decks_are_reproducible(self):
+        assert Deck(seed=7).deal(52) == Deck(seed=7).deal(52)
+        assert Deck(seed=7).deal(52) != Deck(seed=8).deal(52)
+
     def test_to_dict_from_dict_roundtrip(self):
         d = Deck()
         original_cards = [repr(c) for c in d._cards]
@@ -158,5 +214,4 @@ class TestDeck:
         data = d.to_dict()
         d2 = Deck.from_dict(data)
         assert d.remaining == d2.remaining
-        for c1, c2 in zip(d._cards, d2._cards):
-            assert c1 == c2
+        assert d.deal(d.remaining) == d2.deal(d2.remaining)
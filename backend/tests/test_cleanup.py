@@ -0,0 +1,285 @@
+"""Tests for stale game cleanup — with mocked Redis."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.cleanup import (
+    COMPLETED_THRESHOLD,
+    STALE_THRESHOLD,
+    _is_game_won,
+    cleanup_stale_games,
+)
+
+
+PATCH_BASE = "app.cleanup.redis_client"
+PATCH_METRICS = "app.cleanup.metrics"
+
+
+def _engine_data(chips: list[int]) -> dict:
+    return {
+        "seats": [
+            {"player_id": f"p{i}", "chips": c, "is_sitting_out": c <= 0}
+            for i, c in enumerate(chips)
+        ]
+    }
+
+
+# ---------------------------------------------------------------------------
+# _is_game_won
+# ---------------------------------------------------------------------------
+
+
+class TestIsGameWon:
+    def test_none(self):
+        assert not _is_game_won(None)
+
+    def test_single_player_with_chips(self):
+        assert _is_game_won(_engine_data([10000, 0, 0]))
+
+    def test_multiple_players_with_chips(self):
+        assert not _is_game_won(_engine_data([5000, 5000, 0]))
+
+    def test_needs_two_seats(self):
+        assert not _is_game_won(_engine_data([5000]))
+
+
+# ---------------------------------------------------------------------------
+# cleanup_stale_games
+# ---------------------------------------------------------------------------
+
+
+class TestCleanupStaleGames:
+    @pytest.fixture(autouse=True)
+    def _mock_redis(self):
+        self.activity: dict[str, float | None] = {}
+        self.engines: dict[str, dict | None] = {}
+        self.won: dict[str, bool] = {}
+
+        async def _get_activity(code):
+            return self.activity.get(code)
+
+        async def _load_bundle(code):
+            return self.won.get(code), {"status": "active"}, 2
+
+        async def _load_engine(code):
+            return self.engines.get(code)
+
+        async def _scan_codes(cursor, limit):
+            return 0, list(self.activity)
+
+        async def _all_codes():
+            return list(self.activity)
+
+        async def _list_inactive(before, limit=None):
+            return [
+                code for code, ts in self.activity.items()
+                if ts is not None and ts <= before
+            ][:limit]
+
+        with patch(f"{PATCH_BASE}.scan_game_codes", side_effect=_scan_codes) as m_scan, \
+             patch(f"{PATCH_BASE}.list_all_game_codes", side_effect=_all_codes), \
+             patch(f"{PATCH_BASE}.get_cleanup_cursor", new_callable=AsyncMock, return_value=0), \
+             patch(f"{PATCH_BASE}.set_cleanup_cursor", new_callable=AsyncMock) as m_cursor, \
+             patch(f"{PATCH_BASE}.list_inactive_game_codes", side_effect=_list_inactive), \
+             patch(f"{PATCH_BASE}.index_activity", new_callable=AsyncMock) as m_index, \
+             patch(f"{PATCH_BASE}.get_last_activity", side_effect=_get_activity), \
+             patch(f"{PATCH_BASE}.load_cleanup_bundle", side_effect=_load_bundle) as m_bundle, \
+             patch(f"{PATCH_BASE}.load_engine", side_effect=_load_engine) as m_engine, \
+             patch(f"{PATCH_BASE}.touch_activity", new_callable=AsyncMock) as m_touch, \
+             patch(f"{PATCH_BASE}.delete_game", new_callable=AsyncMock) as m_delete, \
+             patch(f"{PATCH_METRICS}.record_games_cleaned_bulk", new_callable=AsyncMock) as m_metric:
+            self.load_engine = m_engine
+            self.load_cleanup_bundle = m_bundle
+            self.touch_activity = m_touch
+            self.index_activity = m_index
+            self.scan_game_codes = m_scan
+            self.set_cleanup_cursor = m_cursor
+            self.delete_game = m_delete
+            self.record_games_cleaned = m_metric
+            yield
+
+    async def test_no_games(self):
+        result = await cleanup_stale_games()
+        assert result == {"deleted": [], "kept": []}
+
+    async def test_fresh_game_kept(self):
+        self.activity["FRESH1"] = time.time()
+        self.engines["FRESH1"] = _engine_data([5000, 5000])
+        result = await cleanup_stale_games(full_scan=True)
+        assert result == {"deleted": [], "kept": ["FRESH1"]}
+        self.delete_game.assert_not_awaited()
+
+    async def test_fresh_game_not_checked_via_index(self):
+        self.activity["FRESH1"] = time.time()
+        self.activity["STALE1"] = time.time() - STALE_THRESHOLD - 60
+        self.engines["STALE1"] = _engine_data([5000, 5000])
+        result = await cleanup_stale_games()
+        assert result == {"deleted": ["STALE1"], "kept": []}
+
+    async def test_fresh_game_skips_bundle_and_engine(self):
+        self.activity["FRESH1"] = time.time()
+        await cleanup_stale_games(full_scan=True)
+        self.load_cleanup_bundle.assert_not_awaited()
+        self.load_engine.assert_not_awaited()
+
+    async def test_full_scan_reindexes_kept_games(self):
+        ts = time.time()
+        self.activity["FRESH1"] = ts
+        self.engines["FRESH1"] = _engine_data([5000, 5000])
+        await cleanup_stale_games(full_scan=True)
+        self.index_activity.assert_awaited_once_with("FRESH1", ts)
+
+    async def test_stale_game_deleted(self):
+        self.activity["STALE1"] = time.time() - STALE_THRESHOLD - 60
+        self.engines["STALE1"] = _engine_data([5000, 5000])
+        result = await cleanup_stale_games()
+        assert result == {"deleted": ["STALE1"], "kept": []}
+        self.delete_game.assert_awaited_once_with("STALE1")
+        self.record_games_cleaned.assert_awaited_once_with(
+            [
+                {
+                    "code": "STALE1",
+                    "final_status": "active",
+                    "was_completed": False,
+                    "player_count": 2,
+                }
+            ]
+        )
+
+    async def test_won_game_kept_until_completed_threshold(self):
+        self.activity["WON1"] = time.time() - STALE_THRESHOLD - 60
+        self.engines["WON1"] = _engine_data([10000, 0])
+        self.activity["WON2"] = time.time() - COMPLETED_THRESHOLD - 60
+        self.engines["WON2"] = _engine_data([10000, 0])
+        result = await cleanup_stale_games()
+        assert result == {"deleted": ["WON2"], "kept": ["WON1"]}
+
+    async def test_pass_is_capped(self):
+        old = time.time() - STALE_THRESHOLD - 60
+        for i in range(5):
+            self.activity[f"STALE{i}"] = old
+            self.engines[f"STALE{i}"] = _engine_data([5000, 5000])
+        with patch("app.cleanup.MAX_CODES_PER_PASS", 3):
+            result = await cleanup_stale_games()
+        assert len(result["deleted"]) == 3
+
+    async def test_metrics_flushed_once_per_pass(self):
+        old = time.time() - STALE_THRESHOLD - 60
+        for i in range(3):
+            self.activity[f"STALE{i}"] = old
+            self.engines[f"STALE{i}"] = _engine_data([5000, 5000])
+        await cleanup_stale_games()
+        self.record_games_cleaned.assert_awaited_once()
+        (entries,), _ = self.record_games_cleaned.call_args
+        assert sorted(e["code"] for e in entries) == ["STALE0", "STALE1", "STALE2"]
+
+    async def test_reconcile_saves_cursor(self):
+        async def _scan_codes(cursor, limit):
+            return 42, ["FRESH1"]
+
+        self.activity["FRESH1"] = time.time()
+        self.engines["FRESH1"] = _engine_data([5000, 5000])
+        with patch(f"{PATCH_BASE}.scan_game_codes", side_effect=_scan_codes):
+            result = await cleanup_stale_games(reconcile=True)
+        assert result == {"deleted": [], "kept": ["FRESH1"]}
+        self.set_cleanup_cursor.assert_awaited_once_with(42)
+
+    async def test_reconcile_also_checks_index(self):
+        async def _scan_codes(cursor, limit):
+            return 42, ["FRESH1", "STALE1"]
+
+        self.activity["FRESH1"] = time.time()
+        self.activity["STALE1"] = time.time() - STALE_THRESHOLD - 60
+        self.engines["STALE1"] = _engine_data([5000, 5000])
+        with patch(f"{PATCH_BASE}.scan_game_codes", side_effect=_scan_codes):
+            result = await cleanup_stale_games(reconcile=True)
+        assert result == {"deleted": ["STALE1"], "kept": ["FRESH1"]}
+        self.delete_game.assert_awaited_once_with("STALE1")
+
+    async def test_full_scan_leaves_cursor_alone(self):
+        old = time.time() - STALE_THRESHOLD - 60
+        for i in range(5):
+            self.activity[f"STALE{i}"] = old
+            self.engines[f"STALE{i}"] = _engine_data([5000, 5000])
+        with patch("app.cleanup.MAX_CODES_PER_PASS", 3):
+            result = await cleanup_stale_games(full_scan=True)
+        assert len(result["deleted"]) == 5
+        self.scan_game_codes.assert_not_awaited()
+        self.set_cleanup_cursor.assert_not_awaited()
+
+    async def test_kept_won_game_rescored_to_eligible_time(self):
+        last = time.time() - STALE_THRESHOLD - 60
+        self.activity["WON1"] = last
+        self.engines["WON1"] = _engine_data([10000, 0])
+        await cleanup_stale_games()
+        self.index_activity.assert_awaited_once_with(
+            "WON1", last + COMPLETED_THRESHOLD - STALE_THRESHOLD
+        )
+
+    async def test_already_deleted_game_not_recorded(self):
+        self.activity["STALE1"] = time.time() - STALE_THRESHOLD - 60
+        self.engines["STALE1"] = _engine_data([5000, 5000])
+        self.delete_game.return_value = False
+        result = await cleanup_stale_games()
+        assert result == {"deleted": [], "kept": ["STALE1"]}
+        self.record_games_cleaned.assert_awaited_once_with([])
+
+    async def test_won_flag_from_meta_skips_engine_load(self):
+        self.activity["WON1"] = time.time() - STALE_THRESHOLD - 60
+        self.won["WON1"] = True
+        self.activity["STALE1"] = time.time() - STALE_THRESHOLD - 60
+        self.won["STALE1"] = False
+        result = await cleanup_stale_games()
+        assert result == {"deleted": ["STALE1"], "kept": ["WON1"]}
+        self.load_engine.assert_not_awaited()
+
+    async def test_missing_activity_touched_and_kept(self):
+        self.activity["NOTS1"] = None
+        result = await cleanup_stale_games(full_scan=True)
+        assert result == {"deleted": [], "kept": ["NOTS1"]}
+        self.touch_activity.assert_awaited_once_with("NOTS1")
+
+    async def test_error_keeps_game_and_continues(self):
+        self.activity["BAD001"] = time.time() - STALE_THRESHOLD - 60
+        self.activity["STALE1"] = time.time() - STALE_THRESHOLD - 60
+        self.engines["STALE1"] = _engine_data([5000, 5000])
+
+        async def _load_bundle(code):
+            if code == "BAD001":
+                raise RuntimeError("boom")
+            return False, None, 2
+
+        with patch(f"{PATCH_BASE}.load_cleanup_bundle", side_effect=_load_bundle):
+            result = await cleanup_stale_games()
+        assert result == {"deleted": ["STALE1"], "kept": ["BAD001"]}
+        # Pushed behind older candidates so it doesn't block the next pass.
+        (code, score), _ = self.index_activity.call_args
+        assert code == "BAD001"
+        assert score > self.activity["BAD001"]
+
+    async def test_metrics_flushed_when_pass_cancelled(self):
+        self.activity["STALE1"] = time.time() - STALE_THRESHOLD - 60
+        self.engines["STALE1"] = _engine_data([5000, 5000])
+        self.activity["SLOW01"] = time.time() - STALE_THRESHOLD - 60
+        started = asyncio.Event()
+
+        async def _load_bundle(code):
+            if code == "SLOW01":
+                started.set()
+                await asyncio.sleep(3600)
+            return self.won.get(code), {"status": "active"}, 2
+
+        with patch(f"{PATCH_BASE}.load_cleanup_bundle", side_effect=_load_bundle):
+            task = asyncio.create_task(cleanup_stale_games())
+            await started.wait()
+            await asyncio.sleep(0)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+        (entries,), _ = self.record_games_cleaned.call_args
+        assert [e["code"] for e in entries] == ["STALE1"]
@@ -327,7 +327,9 @@ class TestHandHistory:
         from app.engine import PlayerAction
         hh.record_action("p0", PlayerAction.FOLD, 0, Street.PREFLOP)
         assert len(hh.actions) == 1
-        assert hh.actions[0]["action"] == "fold"
+        assert hh.to_dict()["actions"] == [
+            {"player_id": "p0", "action": "fold", "amount": 0, "street": "preflop"}
+        ]
 
     def test_record_community(self):
         hh = HandHistory(1)
@@ -343,6 +345,14 @@ class TestHandHistory:
         assert d["actions"] == []
         assert d["winners"] == []
 
+    def test_engine_keeps_latest_histories(self):
+        e = _make_engine(2)
+        with patch("app.engine.MAX_HAND_HISTORIES", 2):
+            for _ in range(3):
+                e.start_new_hand()
+                e.process_action(e.seats[e.action_on_idx].player_id, "fold")
+        assert [h.hand_number for h in e.hand_histories] == [2, 3]
+
 
 # ── Blind schedule ───────────────────────────────────────────────────
 
@@ -394,6 +404,15 @@ class TestBlindSchedule:
         assert _nice_blind(460) == 500  # 500 is closer
         assert _nice_blind(1) == 1
 
+    def test_standard_blinds_match_rule(self):
+        from app.engine import _STANDARD_BLINDS
+        expected = sorted({
+            round(f * d)
+            for d in (1, 10, 100, 1_000, 10_000, 100_000)
+            for f in (1, 1.5, 2, 2.5, 3, 4, 5, 6, 8)
+        })
+        assert list(_STANDARD_BLINDS) == expected
+
     def test_schedule_built_for_target(self):
         """Schedule should be built when target_game_time > 0."""
         e = _make_engine(3, starting_chips=5000, blind_level_duration=20, target_game_time=4)
@@ -440,6 +459,16 @@ class TestBlindSchedule:
         for sb, bb in e.blind_schedule:
             assert sb < bb, f"SB={sb} >= BB={bb}"
 
+    def test_state_schedule_follows_extension(self):
+        """State's blind_schedule picks up levels appended after a build."""
+        e = _make_engine(3, starting_chips=5000, blind_level_duration=20, target_game_time=4)
+        before = e._build_state()["blind_schedule"]
+        assert before == [[sb, bb] for sb, bb in e.blind_schedule]
+        e.blind_schedule.append((e.starting_chips, e.starting_chips * 2))
+        after = e._build_state()["blind_schedule"]
+        assert len(after) == len(before) + 1
+        assert after[-1] == [e.starting_chips, e.starting_chips * 2]
+
     def test_target_game_time_preserved_in_serialization(self):
         """target_game_time should survive to_dict/from_dict round-trip."""
         e = _make_engine(3, starting_chips=5000, blind_level_duration=20, target_game_time=3)
@@ -850,6 +879,13 @@ class TestRebuy:
         e.seats[0].chips = 0
         assert e._can_rebuy(e.seats[0]) is True
 
+    def test_build_state_skips_rebuy_bookkeeping_when_disabled(self):
+        e = _make_engine(3, starting_chips=100, allow_rebuys=False)
+        _deal_and_get(e)
+        with patch.object(e, "_eliminated_ids", wraps=e._eliminated_ids) as m:
+            e._build_state()
+        m.assert_not_called()
+
     def test_bust_adds_to_elimination_order(self):
         """Busting adds player to elimination_order immediately (even if rebuy-eligible)."""
         e = _make_engine(3, starting_chips=100, allow_rebuys=True)
@@ -1,5 +1,8 @@
 """Tests for the hand evaluator."""
 
+import random
+from itertools import combinations
+
 import pytest
 from app.cards import Card, Rank, Suit
 from app.evaluator import (
@@ -172,6 +175,18 @@ class TestEvaluateSeven:
         assert r.category == HandCategory.STRAIGHT
         assert r.tiebreakers == (7,)
 
+    def test_wheel_from_seven(self):
+        cards = _cards("Ah 2d 3c 4s 5h Kd 9c")
+        r = evaluate(cards)
+        assert r.category == HandCategory.STRAIGHT
+        assert r.tiebreakers == (5,)
+
+    def test_full_house_from_two_trips(self):
+        cards = _cards("Kh Kd Kc 9h 9d 9c 2s")
+        r = evaluate(cards)
+        assert r.category == HandCategory.FULL_HOUSE
+        assert r.tiebreakers == (Rank.KING, 9)
+
     def test_too_few_cards_raises(self):
         with pytest.raises(ValueError, match="Need at least 5"):
             evaluate(_cards("Ah Kh Qh"))
@@ -186,6 +201,21 @@ class TestEvaluateSeven:
         r = evaluate(cards)
         assert r.category == HandCategory.ONE_PAIR
 
+    @pytest.mark.parametrize("n", [6, 7])
+    @pytest.mark.parametrize("suits", [list(Suit), [Suit.HEARTS, Suit.SPADES]])
+    def test_matches_best_five_card_subset(self, n, suits):
+        """Random hands agree with scoring every 5-card subset.
+
+        The two-suit deck makes flushes and straight flushes common enough
+        to be exercised too.
+        """
+        rng = random.Random(1234)
+        deck = [Card(rank, suit) for rank in Rank for suit in suits]
+        for _ in range(3000):
+            cards = rng.sample(deck, n)
+            best = max(_evaluate_five(list(c)) for c in combinations(cards, 5))
+            assert evaluate(cards) == best, cards
+
 
 # ── determine_winners ────────────────────────────────────────────────
 
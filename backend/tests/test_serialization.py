@@ -134,6 +134,15 @@ class TestEngineSerialization:
         e2 = GameEngine.from_dict(data)
         assert "p0" in e2.shown_cards
 
+    def test_restored_shown_cards_ids_are_interned(self):
+        e = _make_engine(3)
+        data = e.to_dict()
+        # Ids parsed from JSON are fresh strings, not the interned ones.
+        data["shown_cards"] = ["".join(["p", "0"])]
+        e2 = GameEngine.from_dict(data)
+        (pid,) = e2.shown_cards
+        assert pid is e2.seats[0].player_id
+
     def test_roundtrip_preserves_pause_state(self):
         e = _make_engine(3)
         e.start_new_hand()